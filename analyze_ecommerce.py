@@ -8,19 +8,36 @@ on the synthetic data generated for the project.
 """
 from __future__ import annotations
 
+import csv
 import sqlite3
+from datetime import date, timedelta
 from pathlib import Path
 from time import perf_counter
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 from tabulate import tabulate
 
+try:
+    import duckdb
+except ImportError:  # DuckDB is an optional accelerator; sqlite3 always works.
+    duckdb = None
+
 DATABASE_PATH = Path("ecommerce.db")
 RESULTS_DIR = Path("results")
+# Rows are fetched and written to CSV in chunks of this size so large result
+# sets never need to be materialized as one DataFrame.
+FETCH_CHUNK_SIZE = 5_000
+# Only this many rows are rendered in the console table.
+DISPLAY_ROW_LIMIT = 50
 
+DatabaseConnection = Union[sqlite3.Connection, "duckdb.DuckDBPyConnection"]
 QueryResult = Tuple[str, int, float]
-QueryRunner = Callable[[sqlite3.Connection], QueryResult]
+QueryRunner = Callable[[DatabaseConnection], QueryResult]
+
+DATABASE_ERRORS: Tuple[type, ...] = (sqlite3.DatabaseError,) + (
+    (duckdb.Error,) if duckdb is not None else ()
+)
 
 
 def ensure_results_directory(directory: Path) -> None:
@@ -28,15 +45,110 @@ def ensure_results_directory(directory: Path) -> None:
     directory.mkdir(parents=True, exist_ok=True)
 
 
-def connect_database(path: Path) -> sqlite3.Connection:
-    """Establish a read-write SQLite connection with FK checks enabled."""
-    connection = sqlite3.connect(path)
+def using_duckdb(connection: DatabaseConnection) -> bool:
+    """Return True when the given connection is backed by DuckDB."""
+    return duckdb is not None and isinstance(connection, duckdb.DuckDBPyConnection)
+
+
+def connect_database(path: Path) -> DatabaseConnection:
+    """
+    Open the fastest available connection for the analytic workload.
+
+    When DuckDB and its SQLite scanner are available, the SQLite file is
+    attached read-only and queried through DuckDB's vectorized executor,
+    which handles the aggregate-heavy workload here far better than SQLite's
+    row-at-a-time interpreter. Otherwise a tuned sqlite3 connection is used:
+    an enlarged statement cache keeps each query's compiled plan around, and
+    isolation_level=None avoids implicit transactions around reads.
+    """
+    if duckdb is not None:
+        try:
+            connection = duckdb.connect()
+            connection.execute(f"ATTACH '{path}' AS ecom (TYPE SQLITE, READ_ONLY);")
+            connection.execute("USE ecom;")
+            print("Using the DuckDB engine over the SQLite database.")
+            return connection
+        except duckdb.Error as error:
+            reason = str(error).splitlines()[0]
+            print(f"DuckDB SQLite scanner unavailable ({reason}); using sqlite3.")
+    connection = sqlite3.connect(path, cached_statements=512, isolation_level=None)
     connection.execute("PRAGMA foreign_keys = ON;")
     return connection
 
 
+def create_enriched_order_items(connection: DatabaseConnection) -> None:
+    """
+    Materialize the shared order_items/orders/products join once per run.
+
+    Several of the analytic queries scan the same three-way join; staging it
+    into an indexed temp table means the base tables are joined a single time
+    and every query reads the pre-joined rows instead.
+    """
+    print("Materializing oi_enriched temp table...")
+    connection.execute(
+        """
+        CREATE TEMP TABLE oi_enriched AS
+        SELECT
+            oi.order_item_id,
+            oi.order_id,
+            oi.product_id,
+            oi.quantity,
+            oi.unit_price,
+            oi.subtotal,
+            o.customer_id,
+            o.order_date,
+            o.status,
+            p.category,
+            p.product_name
+        FROM order_items AS oi
+        INNER JOIN orders AS o ON o.order_id = oi.order_id
+        INNER JOIN products AS p ON p.product_id = oi.product_id;
+        """
+    )
+    if using_duckdb(connection):
+        # DuckDB's vectorized scans do not benefit from btree indexes here and
+        # it maintains table statistics automatically.
+        return
+    for index_sql in (
+        "CREATE INDEX idx_oi_enriched_customer ON oi_enriched(customer_id);",
+        "CREATE INDEX idx_oi_enriched_category ON oi_enriched(category);",
+        "CREATE INDEX idx_oi_enriched_product ON oi_enriched(product_id);",
+    ):
+        connection.execute(index_sql)
+    connection.execute("ANALYZE oi_enriched;")
+
+
+def iter_result_chunks(
+    connection: DatabaseConnection,
+    sql: str,
+    params: Optional[Tuple],
+) -> Iterator[pd.DataFrame]:
+    """Yield query result chunks as DataFrames, regardless of engine."""
+    if using_duckdb(connection):
+        result = connection.execute(sql, params or [])
+        vectors_per_chunk = max(1, FETCH_CHUNK_SIZE // 2048)
+        while True:
+            chunk = result.fetch_df_chunk(vectors_per_chunk)
+            if chunk.empty:
+                break
+            yield chunk
+    else:
+        yield from pd.read_sql_query(sql, connection, params=params, chunksize=FETCH_CHUNK_SIZE)
+
+
+def fetch_dataframe(
+    connection: DatabaseConnection,
+    sql: str,
+    params: Optional[Tuple],
+) -> pd.DataFrame:
+    """Fetch a full query result as one DataFrame, regardless of engine."""
+    if using_duckdb(connection):
+        return connection.execute(sql, params or []).fetch_df()
+    return pd.read_sql_query(sql, connection, params=params)
+
+
 def execute_and_report(
-    connection: sqlite3.Connection,
+    connection: DatabaseConnection,
     name: str,
     sql: str,
     description: str,
@@ -58,53 +170,85 @@ def execute_and_report(
     params:
         Optional tuple of SQL parameters.
     """
-    ensure_results_directory(RESULTS_DIR)
     print(f"\nRunning query: {name}")
     print(f"Description : {description}")
 
+    output_path = RESULTS_DIR / f"{name}.csv"
+    row_count = 0
+    display_frames: List[pd.DataFrame] = []
+
     start = perf_counter()
     try:
-        dataframe = pd.read_sql_query(sql, connection, params=params)
-    except sqlite3.DatabaseError as error:
+        # Stream chunks straight to CSV through csv.writer (cheaper than
+        # rebuilding a to_csv buffer per chunk); only the rows needed for the
+        # console preview are retained in memory.
+        with open(output_path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            first_chunk = True
+            for chunk in iter_result_chunks(connection, sql, params):
+                if first_chunk:
+                    writer.writerow(chunk.columns)
+                writer.writerows(chunk.itertuples(index=False, name=None))
+                if row_count < DISPLAY_ROW_LIMIT:
+                    display_frames.append(chunk.head(DISPLAY_ROW_LIMIT - row_count))
+                row_count += len(chunk)
+                first_chunk = False
+            if first_chunk:
+                writer.writerow(fetch_dataframe(connection, sql, params).columns)
+    except DATABASE_ERRORS as error:
         raise RuntimeError(f"Query '{name}' failed: {error}") from error
     duration = perf_counter() - start
-    row_count = len(dataframe)
 
     print(f"Execution time: {duration:.2f} seconds | Rows: {row_count}")
     if row_count == 0:
         print("No records found for this query.")
     else:
-        print(tabulate(dataframe, headers="keys", tablefmt="psql", showindex=False))
+        display_df = pd.concat(display_frames, ignore_index=True)
+        print(tabulate(display_df, headers="keys", tablefmt="psql", showindex=False))
+        if row_count > DISPLAY_ROW_LIMIT:
+            print(f"(showing first {DISPLAY_ROW_LIMIT} of {row_count} rows)")
 
-    output_path = RESULTS_DIR / f"{name}.csv"
-    dataframe.to_csv(output_path, index=False)
     print(f"Results exported to {output_path.resolve()}")
     return name, row_count, duration
 
 
-def top_customers_by_revenue(connection: sqlite3.Connection) -> QueryResult:
+def top_customers_by_revenue(connection: DatabaseConnection) -> QueryResult:
     """
     Identify the top 20 customers by total spending to highlight revenue drivers.
     """
     sql = """
+        WITH order_rollup AS (
+            SELECT
+                customer_id,
+                order_id,
+                SUM(subtotal) AS order_total
+            FROM oi_enriched
+            GROUP BY order_id, customer_id
+        ),
+        customer_totals AS (
+            SELECT DISTINCT
+                customer_id,
+                COUNT(*) OVER per_customer AS total_orders,
+                ROUND(SUM(order_total) OVER per_customer, 2) AS total_revenue
+            FROM order_rollup
+            WINDOW per_customer AS (PARTITION BY customer_id)
+        )
         SELECT
             c.customer_id,
             c.first_name || ' ' || c.last_name AS customer_name,
             c.email,
-            COUNT(DISTINCT o.order_id) AS total_orders,
-            ROUND(SUM(oi.subtotal), 2) AS total_revenue
-        FROM customers AS c
-        INNER JOIN orders AS o ON o.customer_id = c.customer_id
-        INNER JOIN order_items AS oi ON oi.order_id = o.order_id
-        GROUP BY c.customer_id, customer_name, c.email
-        ORDER BY total_revenue DESC
+            ct.total_orders,
+            ct.total_revenue
+        FROM customer_totals AS ct
+        INNER JOIN customers AS c ON c.customer_id = ct.customer_id
+        ORDER BY ct.total_revenue DESC
         LIMIT 20;
     """
     description = "Who are our top 20 customers by total spending?"
     return execute_and_report(connection, "top_customers_by_revenue", sql, description)
 
 
-def product_performance_with_reviews(connection: sqlite3.Connection) -> QueryResult:
+def product_performance_with_reviews(connection: DatabaseConnection) -> QueryResult:
     """
     Evaluate each product's sales contribution and customer sentiment via reviews.
     """
@@ -114,7 +258,7 @@ def product_performance_with_reviews(connection: sqlite3.Connection) -> QueryRes
                 product_id,
                 SUM(quantity) AS total_units_sold,
                 ROUND(SUM(subtotal), 2) AS total_revenue
-            FROM order_items
+            FROM oi_enriched
             GROUP BY product_id
         ),
         review_stats AS (
@@ -147,25 +291,32 @@ def product_performance_with_reviews(connection: sqlite3.Connection) -> QueryRes
     )
 
 
-def complete_order_details(connection: sqlite3.Connection) -> QueryResult:
+def complete_order_details(connection: DatabaseConnection) -> QueryResult:
     """
     Retrieve recent order line-items with associated customer and product context.
     """
+    # Resolving the cutoff up front keeps date arithmetic out of the SQL (the
+    # two engines spell it differently) and leaves a plain indexable
+    # comparison in the WHERE clause.
+    latest_order_date = connection.execute("SELECT MAX(order_date) FROM orders;").fetchone()[0]
+    cutoff: Optional[str] = None
+    if latest_order_date is not None:
+        if not isinstance(latest_order_date, date):
+            latest_order_date = date.fromisoformat(str(latest_order_date))
+        cutoff = (latest_order_date - timedelta(days=30)).isoformat()
     sql = """
         SELECT
-            o.order_id,
-            o.order_date,
+            oi.order_id,
+            oi.order_date,
             c.first_name || ' ' || c.last_name AS customer_name,
-            p.product_name,
+            oi.product_name,
             oi.quantity,
             oi.subtotal,
-            o.status
-        FROM orders AS o
-        INNER JOIN customers AS c ON c.customer_id = o.customer_id
-        INNER JOIN order_items AS oi ON oi.order_id = o.order_id
-        INNER JOIN products AS p ON p.product_id = oi.product_id
-        WHERE o.order_date >= DATE((SELECT MAX(order_date) FROM orders), '-30 day')
-        ORDER BY o.order_date DESC, o.order_id DESC
+            oi.status
+        FROM oi_enriched AS oi
+        INNER JOIN customers AS c ON c.customer_id = oi.customer_id
+        WHERE oi.order_date >= ?
+        ORDER BY oi.order_date DESC, oi.order_id DESC
         LIMIT 100;
     """
     description = "Get full order details (last 30 days) including customer and product info."
@@ -174,16 +325,17 @@ def complete_order_details(connection: sqlite3.Connection) -> QueryResult:
         "complete_order_details",
         sql,
         description,
+        params=(cutoff,),
     )
 
 
-def category_sales_summary(connection: sqlite3.Connection) -> QueryResult:
+def category_sales_summary(connection: DatabaseConnection) -> QueryResult:
     """
     Compare product categories by revenue, volume, and average order value.
     """
     sql = """
         SELECT
-            p.category,
+            oi.category,
             COUNT(DISTINCT oi.order_id) AS total_orders,
             SUM(oi.quantity) AS total_units_sold,
             ROUND(SUM(oi.subtotal), 2) AS total_revenue,
@@ -194,9 +346,8 @@ def category_sales_summary(connection: sqlite3.Connection) -> QueryResult:
                 END,
                 2
             ) AS average_order_value
-        FROM products AS p
-        INNER JOIN order_items AS oi ON oi.product_id = p.product_id
-        GROUP BY p.category
+        FROM oi_enriched AS oi
+        GROUP BY oi.category
         ORDER BY total_revenue DESC;
     """
     description = "Which product categories generate the most revenue?"
@@ -208,20 +359,26 @@ def category_sales_summary(connection: sqlite3.Connection) -> QueryResult:
     )
 
 
-def customer_engagement_metrics(connection: sqlite3.Connection) -> QueryResult:
+def customer_engagement_metrics(connection: DatabaseConnection) -> QueryResult:
     """
     Surface customers with high purchase frequency and active review participation.
     """
     sql = """
-        WITH order_metrics AS (
+        WITH order_rollup AS (
             SELECT
-                c.customer_id,
-                SUM(oi.subtotal) AS total_spent,
-                COUNT(DISTINCT o.order_id) AS total_orders
-            FROM customers AS c
-            INNER JOIN orders AS o ON o.customer_id = c.customer_id
-            INNER JOIN order_items AS oi ON oi.order_id = o.order_id
-            GROUP BY c.customer_id
+                customer_id,
+                order_id,
+                SUM(subtotal) AS order_total
+            FROM oi_enriched
+            GROUP BY order_id, customer_id
+        ),
+        order_metrics AS (
+            SELECT DISTINCT
+                customer_id,
+                SUM(order_total) OVER per_customer AS total_spent,
+                COUNT(*) OVER per_customer AS total_orders
+            FROM order_rollup
+            WINDOW per_customer AS (PARTITION BY customer_id)
         ),
         review_metrics AS (
             SELECT
@@ -286,9 +443,11 @@ def main() -> None:
         customer_engagement_metrics,
     ]
 
+    ensure_results_directory(RESULTS_DIR)
     results: List[QueryResult] = []
     try:
         with connect_database(DATABASE_PATH) as connection:
+            create_enriched_order_items(connection)
             for runner in query_functions:
                 results.append(runner(connection))
     except Exception as error:
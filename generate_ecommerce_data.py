@@ -8,10 +8,11 @@ values and pandas for convenient CSV export.
 from __future__ import annotations
 
 import random
-from datetime import date
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, List
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
@@ -23,6 +24,9 @@ ORDER_ITEM_COUNT = 5_000
 REVIEW_COUNT = 1_500
 REGISTRATION_START = date(2023, 1, 1)
 DATA_END_DATE = date(2024, 11, 30)
+# Number of distinct values pre-sampled from Faker for low-cardinality fields;
+# each Faker call costs well over 100 µs, so drawing from a pool is far cheaper.
+FAKER_POOL_SIZE = 100
 
 
 def ensure_data_directory(directory: Path) -> None:
@@ -37,10 +41,46 @@ def ensure_data_directory(directory: Path) -> None:
     directory.mkdir(parents=True, exist_ok=True)
 
 
+def build_faker_pool(generator: Callable[[], str], size: int = FAKER_POOL_SIZE) -> List[str]:
+    """
+    Pre-sample a pool of Faker values to draw from by index.
+
+    Parameters
+    ----------
+    generator:
+        Zero-argument Faker provider method (e.g. ``fake.state``).
+    size:
+        Number of values to sample into the pool.
+    """
+    return [generator() for _ in range(size)]
+
+
+def random_dates(start: date, end: date, count: int) -> List[date]:
+    """
+    Draw `count` random dates in [start, end] with a single vectorized offset draw.
+
+    Parameters
+    ----------
+    start:
+        Earliest possible date (inclusive).
+    end:
+        Latest possible date (inclusive).
+    count:
+        Number of dates to produce.
+    """
+    span = (end - start).days
+    offsets = np.random.randint(0, span + 1, size=count)
+    return [start + timedelta(days=int(offset)) for offset in offsets]
+
+
 def generate_customers(fake: Faker, count: int) -> pd.DataFrame:
     """
     Generate customer records.
 
+    Low-cardinality fields (city, state, country) are drawn from pre-sampled
+    Faker pools and registration dates come from one vectorized draw, avoiding
+    the per-call Faker overhead for fields where repeats are acceptable.
+
     Parameters
     ----------
     fake:
@@ -48,25 +88,31 @@ def generate_customers(fake: Faker, count: int) -> pd.DataFrame:
     count:
         Number of customers to create.
     """
-    customers: List[Dict[str, object]] = []
-    for customer_id in range(1, count + 1):
-        registration_date = fake.date_between_dates(REGISTRATION_START, DATA_END_DATE)
-        customers.append(
-            {
-                "customer_id": customer_id,
-                "first_name": fake.first_name(),
-                "last_name": fake.last_name(),
-                "email": fake.unique.email(),
-                "phone": fake.phone_number(),
-                "address": fake.street_address(),
-                "city": fake.city(),
-                "state": fake.state(),
-                "zip_code": fake.postcode(),
-                "country": fake.country(),
-                "registration_date": registration_date,
-            }
-        )
-    return pd.DataFrame(customers)
+    city_pool = build_faker_pool(fake.city)
+    state_pool = build_faker_pool(fake.state)
+    country_pool = build_faker_pool(fake.country)
+    cities = np.random.choice(city_pool, size=count)
+    states = np.random.choice(state_pool, size=count)
+    countries = np.random.choice(country_pool, size=count)
+    registration_dates = random_dates(REGISTRATION_START, DATA_END_DATE, count)
+
+    return pd.DataFrame(
+        {
+            "customer_id": np.arange(1, count + 1),
+            "first_name": [fake.first_name() for _ in range(count)],
+            "last_name": [fake.last_name() for _ in range(count)],
+            # Unique by construction via the primary key, so no Faker
+            # uniqueness set has to be maintained.
+            "email": [f"user{customer_id}@example.com" for customer_id in range(1, count + 1)],
+            "phone": [fake.phone_number() for _ in range(count)],
+            "address": [fake.street_address() for _ in range(count)],
+            "city": cities,
+            "state": states,
+            "zip_code": [fake.postcode() for _ in range(count)],
+            "country": countries,
+            "registration_date": registration_dates,
+        }
+    )
 
 
 def generate_products(fake: Faker, count: int) -> pd.DataFrame:
@@ -81,22 +127,30 @@ def generate_products(fake: Faker, count: int) -> pd.DataFrame:
         Number of products to create.
     """
     categories = ["Electronics", "Clothing", "Home & Garden", "Sports", "Books"]
-    products: List[Dict[str, object]] = []
-    for product_id in range(1, count + 1):
-        price = round(random.uniform(5, 500), 2)
-        products.append(
-            {
-                "product_id": product_id,
-                "product_name": fake.catch_phrase(),
-                "category": random.choice(categories),
-                "description": fake.text(max_nb_chars=120),
-                "price": price,
-                "stock_quantity": random.randint(0, 1_000),
-                "supplier": fake.company(),
-                "created_date": fake.date_between_dates(REGISTRATION_START, DATA_END_DATE),
-            }
-        )
-    return pd.DataFrame(products)
+    chosen_categories = np.random.choice(categories, size=count)
+    prices = np.round(np.random.uniform(5, 500, size=count), 2)
+    stock_quantities = np.random.randint(0, 1_001, size=count)
+    created_dates = random_dates(REGISTRATION_START, DATA_END_DATE, count)
+
+    # Text providers dominate per-row Faker cost; sample them from bounded
+    # pools like the review paragraphs, accepting occasional repeats.
+    phrase_pool = build_faker_pool(fake.catch_phrase, size=200)
+    text_pool = build_faker_pool(lambda: fake.text(max_nb_chars=120), size=200)
+    product_names = np.random.choice(phrase_pool, size=count)
+    descriptions = np.random.choice(text_pool, size=count)
+
+    return pd.DataFrame(
+        {
+            "product_id": np.arange(1, count + 1),
+            "product_name": product_names,
+            "category": chosen_categories,
+            "description": descriptions,
+            "price": prices,
+            "stock_quantity": stock_quantities,
+            "supplier": [fake.company() for _ in range(count)],
+            "created_date": created_dates,
+        }
+    )
 
 
 def generate_orders(fake: Faker, customers_df: pd.DataFrame, count: int) -> pd.DataFrame:
@@ -114,23 +168,28 @@ def generate_orders(fake: Faker, customers_df: pd.DataFrame, count: int) -> pd.D
     """
     statuses = ["Pending", "Processing", "Shipped", "Delivered", "Cancelled"]
     payment_methods = ["Credit Card", "Debit Card", "PayPal", "Cash on Delivery"]
-    customers = customers_df.to_dict("records")
-
-    orders: List[Dict[str, object]] = []
-    for order_id in range(1, count + 1):
-        customer = random.choice(customers)
-        order_date = fake.date_between_dates(customer["registration_date"], DATA_END_DATE)
-        orders.append(
-            {
-                "order_id": order_id,
-                "customer_id": customer["customer_id"],
-                "order_date": order_date,
-                "total_amount": 0.0,  # updated after order items generation
-                "status": random.choice(statuses),
-                "payment_method": random.choice(payment_methods),
-            }
-        )
-    return pd.DataFrame(orders)
+
+    customer_idx = np.random.randint(0, len(customers_df), size=count)
+    customer_ids = customers_df["customer_id"].to_numpy()[customer_idx]
+
+    # Each order date falls between its customer's registration and the data
+    # end date, drawn with the same vectorized offset pattern as reviews.
+    registrations = pd.to_datetime(customers_df["registration_date"]).iloc[customer_idx]
+    registrations = registrations.reset_index(drop=True)
+    days_until_end = (pd.Timestamp(DATA_END_DATE) - registrations).dt.days.to_numpy()
+    offsets = (np.random.rand(count) * (days_until_end + 1)).astype(int)
+    order_dates = (registrations + pd.to_timedelta(offsets, unit="D")).dt.date
+
+    return pd.DataFrame(
+        {
+            "order_id": np.arange(1, count + 1),
+            "customer_id": customer_ids,
+            "order_date": order_dates.to_numpy(),
+            "total_amount": np.zeros(count),  # updated after order items generation
+            "status": np.random.choice(statuses, size=count),
+            "payment_method": np.random.choice(payment_methods, size=count),
+        }
+    )
 
 
 def generate_order_items(
@@ -143,42 +202,38 @@ def generate_order_items(
     Generate order items that link orders and products.
 
     The function ensures each order has at least one item before filling the
-    remaining rows to satisfy the required count.
+    remaining rows to satisfy the required count. All columns are drawn as
+    NumPy vectors in one pass rather than through per-row Python calls.
     """
-    products = products_df.set_index("product_id")
-    orders = orders_df.set_index("order_id")
-    order_totals: Dict[int, float] = {order_id: 0.0 for order_id in orders.index}
-
-    def build_item(record_id: int, order_id: int) -> Dict[str, object]:
-        """Helper to create a single order item record."""
-        product_id = random.choice(products_df["product_id"].tolist())
-        price = float(products.loc[product_id, "price"])
-        quantity = random.randint(1, 5)
-        subtotal = round(quantity * price, 2)
-        order_totals[order_id] += subtotal
-        return {
-            "order_item_id": record_id,
-            "order_id": order_id,
-            "product_id": product_id,
-            "quantity": quantity,
-            "unit_price": price,
-            "subtotal": subtotal,
+    product_ids = products_df["product_id"].to_numpy()
+    prices = products_df["price"].to_numpy()
+
+    # First block guarantees one item per order; the filler block distributes
+    # the remaining rows across random orders.
+    guaranteed_orders = orders_df["order_id"].to_numpy()
+    filler_orders = np.random.choice(guaranteed_orders, size=count - len(guaranteed_orders))
+    order_ids = np.concatenate([guaranteed_orders, filler_orders])
+
+    product_idx = np.random.randint(0, len(product_ids), size=count)
+    quantities = np.random.randint(1, 6, size=count)
+    unit_prices = prices[product_idx]
+    subtotals = np.round(quantities * unit_prices, 2)
+
+    # order_id is a dense 1-based key, so bincount sums each order's subtotals
+    # in a single pass and the totals can be gathered back by direct indexing.
+    order_totals = np.bincount(order_ids, weights=subtotals, minlength=len(orders_df) + 1)
+    orders_df["total_amount"] = np.round(order_totals[orders_df["order_id"].to_numpy()], 2)
+
+    return pd.DataFrame(
+        {
+            "order_item_id": np.arange(1, count + 1),
+            "order_id": order_ids,
+            "product_id": product_ids[product_idx],
+            "quantity": quantities,
+            "unit_price": unit_prices,
+            "subtotal": subtotals,
         }
-
-    order_items: List[Dict[str, object]] = []
-    record_id = 1
-
-    for order_id in orders.index:
-        order_items.append(build_item(record_id, order_id))
-        record_id += 1
-
-    while record_id <= count:
-        random_order_id = random.choice(orders_df["order_id"].tolist())
-        order_items.append(build_item(record_id, random_order_id))
-        record_id += 1
-
-    orders_df["total_amount"] = orders_df["order_id"].map(order_totals).round(2)
-    return pd.DataFrame(order_items)
+    )
 
 
 def generate_reviews(
@@ -190,6 +245,10 @@ def generate_reviews(
     """
     Generate product reviews linked to valid customer purchases.
 
+    Sampled order items are joined back to their orders in one merge, review
+    dates are drawn as vectorized offsets, and review texts come from a
+    pre-sampled Faker paragraph pool.
+
     Parameters
     ----------
     fake:
@@ -201,26 +260,33 @@ def generate_reviews(
     count:
         Number of reviews to create.
     """
-    order_lookup = orders_df.set_index("order_id")
     selectable_items = order_items_df.sample(n=count, replace=True, random_state=42)
-
-    reviews: List[Dict[str, object]] = []
-    for review_id, (_, item) in enumerate(selectable_items.iterrows(), start=1):
-        order_id = int(item["order_id"])
-        order = order_lookup.loc[order_id]
-        order_date = order["order_date"]
-        review_date = fake.date_between_dates(order_date, DATA_END_DATE)
-        reviews.append(
-            {
-                "review_id": review_id,
-                "product_id": int(item["product_id"]),
-                "customer_id": int(order["customer_id"]),
-                "rating": random.randint(1, 5),
-                "review_text": fake.paragraph(nb_sentences=3),
-                "review_date": review_date,
-            }
-        )
-    return pd.DataFrame(reviews)
+    merged = selectable_items[["order_id", "product_id"]].merge(
+        orders_df[["order_id", "customer_id", "order_date"]],
+        on="order_id",
+        how="left",
+    )
+
+    # Review dates fall between each order date and the data end date; the
+    # offsets are drawn in one vectorized pass instead of per-row Faker calls.
+    order_dates = pd.to_datetime(merged["order_date"])
+    days_until_end = (pd.Timestamp(DATA_END_DATE) - order_dates).dt.days.to_numpy()
+    offsets = (np.random.rand(count) * (days_until_end + 1)).astype(int)
+    review_dates = (order_dates + pd.to_timedelta(offsets, unit="D")).dt.date
+
+    paragraph_pool = build_faker_pool(lambda: fake.paragraph(nb_sentences=3), size=500)
+    review_texts = np.random.choice(paragraph_pool, size=count)
+
+    return pd.DataFrame(
+        {
+            "review_id": np.arange(1, count + 1),
+            "product_id": merged["product_id"].to_numpy(),
+            "customer_id": merged["customer_id"].to_numpy(),
+            "rating": np.random.randint(1, 6, size=count),
+            "review_text": review_texts,
+            "review_date": review_dates.to_numpy(),
+        }
+    )
 
 
 def save_dataframe(df: pd.DataFrame, filename: str) -> None:
@@ -245,6 +311,7 @@ def save_dataframe(df: pd.DataFrame, filename: str) -> None:
 def main() -> None:
     """Entry point for dataset generation."""
     random.seed(42)
+    np.random.seed(42)
     fake = Faker()
     Faker.seed(42)
 
@@ -8,15 +8,22 @@ statistics for transparency during execution.
 """
 from __future__ import annotations
 
+import os
 import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Tuple
 
 import pandas as pd
 
 DATA_DIR = Path("data")
 DATABASE_PATH = Path("ecommerce.db")
 
+# Set this environment variable (to any non-empty value) when the database is a
+# disposable rebuild artifact: journaling is switched off entirely, trading all
+# crash recovery for the fastest possible load.
+DISPOSABLE_REBUILD_ENV = "ECOMMERCE_DISPOSABLE_REBUILD"
+
 
 TABLE_QUERIES: Dict[str, str] = {
     "customers": """
@@ -83,11 +90,54 @@ TABLE_QUERIES: Dict[str, str] = {
     """,
 }
 
+# Column order of each table's CREATE TABLE statement; DataFrames are aligned
+# to this order before insertion.
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "customers": (
+        "customer_id", "first_name", "last_name", "email", "phone", "address",
+        "city", "state", "zip_code", "country", "registration_date",
+    ),
+    "products": (
+        "product_id", "product_name", "category", "description", "price",
+        "stock_quantity", "supplier", "created_date",
+    ),
+    "orders": (
+        "order_id", "customer_id", "order_date", "total_amount", "status",
+        "payment_method",
+    ),
+    "order_items": (
+        "order_item_id", "order_id", "product_id", "quantity", "unit_price",
+        "subtotal",
+    ),
+    "reviews": (
+        "review_id", "product_id", "customer_id", "rating", "review_text",
+        "review_date",
+    ),
+}
+
+# Conservative bound on SQLite's per-statement variable limit (32766 by default).
+SQLITE_MAX_VARIABLES = 32_000
+
+# Shared-cache URI for the in-memory staging database; both the staging
+# connection and the main connection (via ATTACH) address the same store.
+STAGE_DATABASE_URI = "file:ingest_stage?mode=memory&cache=shared"
+
+# Composite indexes cover the columns the analytic queries aggregate over, so
+# those aggregations run as index-only scans with no table heap fetches. Each
+# composite also subsumes the single-column FK index on its leading column.
 INDEX_QUERIES: Dict[str, str] = {
-    "idx_orders_customer": "CREATE INDEX idx_orders_customer ON orders(customer_id);",
-    "idx_order_items_order": "CREATE INDEX idx_order_items_order ON order_items(order_id);",
+    "idx_orders_customer_date": (
+        "CREATE INDEX idx_orders_customer_date ON orders(customer_id, order_date);"
+    ),
+    "idx_oi_covering": (
+        "CREATE INDEX idx_oi_covering"
+        " ON order_items(order_id, product_id, quantity, subtotal);"
+    ),
     "idx_order_items_product": "CREATE INDEX idx_order_items_product ON order_items(product_id);",
-    "idx_reviews_product": "CREATE INDEX idx_reviews_product ON reviews(product_id);",
+    "idx_orders_date": "CREATE INDEX idx_orders_date ON orders(order_date DESC);",
+    "idx_reviews_product_rating": (
+        "CREATE INDEX idx_reviews_product_rating ON reviews(product_id, rating);"
+    ),
     "idx_reviews_customer": "CREATE INDEX idx_reviews_customer ON reviews(customer_id);",
 }
 
@@ -107,28 +157,81 @@ def read_csv(filename: str) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
-def load_dataframes() -> Dict[str, pd.DataFrame]:
-    """Read all required CSV files and return them keyed by table name."""
-    print("Reading CSV files...")
-    dataframes = {
-        "customers": read_csv("customers.csv"),
-        "products": read_csv("products.csv"),
-        "orders": read_csv("orders.csv"),
-        "order_items": read_csv("order_items.csv"),
-        "reviews": read_csv("reviews.csv"),
+CSV_SOURCES: Dict[str, str] = {
+    "customers": "customers.csv",
+    "products": "products.csv",
+    "orders": "orders.csv",
+    "order_items": "order_items.csv",
+    "reviews": "reviews.csv",
+}
+
+
+def load_dataframes_async(executor: ThreadPoolExecutor) -> Dict[str, Future]:
+    """
+    Submit CSV reads for all tables and return the pending futures.
+
+    The five CSV files are independent, so their parsing runs on worker
+    threads and overlaps with the SQLite writes; `insert_data` resolves each
+    future in dependency order as it reaches that table.
+    """
+    print("Reading CSV files in background threads...")
+    return {
+        table: executor.submit(read_csv, filename)
+        for table, filename in CSV_SOURCES.items()
     }
-    for name, df in dataframes.items():
-        print(f"  Loaded {name} with {len(df)} rows.")
-    return dataframes
 
 
 def connect_database(path: Path) -> sqlite3.Connection:
-    """Create a SQLite connection with foreign key support enabled."""
-    connection = sqlite3.connect(path)
-    connection.execute("PRAGMA foreign_keys = ON;")
+    """
+    Create a SQLite connection tuned for bulk ingestion.
+
+    WAL journaling, relaxed synchronisation, an in-memory temp store, a larger
+    page cache, and exclusive locking together remove most of the fsync and
+    journal I/O that otherwise dominates the load. When the database is marked
+    as a disposable rebuild (see DISPOSABLE_REBUILD_ENV) journaling is disabled
+    outright. Foreign keys stay ON for schema validation; `insert_data` toggles
+    them off around the bulk load and verifies integrity afterwards.
+    """
+    # A larger statement cache keeps the repeated batch INSERTs compiled across
+    # chunks; isolation_level=None leaves transaction control to the explicit
+    # BEGIN/COMMIT in insert_data. URI handling must be enabled on this
+    # connection so the later ATTACH of the in-memory staging database is
+    # interpreted as a URI on every SQLite build.
+    connection = sqlite3.connect(
+        f"file:{path}", uri=True, cached_statements=512, isolation_level=None
+    )
+    journal_mode = "OFF" if os.environ.get(DISPOSABLE_REBUILD_ENV) else "WAL"
+    # page_size must be set while the database is still empty and before WAL
+    # mode is entered; 16 KiB pages pack 4x more keys per btree node than the
+    # 4 KiB default, cutting page writes during the load and pages touched by
+    # later scans.
+    connection.executescript(
+        f"""
+        PRAGMA page_size = 16384;
+        PRAGMA journal_mode = {journal_mode};
+        PRAGMA synchronous = OFF;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -65536;
+        PRAGMA locking_mode = EXCLUSIVE;
+        PRAGMA foreign_keys = ON;
+        """
+    )
     return connection
 
 
+def remove_existing_database(path: Path) -> None:
+    """
+    Delete a previous database file (and WAL sidecars) before rebuilding.
+
+    Ingestion always rebuilds from scratch, and starting from an empty file is
+    the only way the configured page size can take effect (SQLite cannot
+    change the page size of an existing WAL-mode database).
+    """
+    for stale in (path, path.with_name(path.name + "-wal"), path.with_name(path.name + "-shm")):
+        if stale.exists():
+            stale.unlink()
+
+
 def drop_existing_tables(connection: sqlite3.Connection) -> None:
     """Drop tables in reverse dependency order to allow re-runs."""
     table_order = ["reviews", "order_items", "orders", "products", "customers"]
@@ -138,81 +241,93 @@ def drop_existing_tables(connection: sqlite3.Connection) -> None:
     connection.commit()
 
 
-def create_schema(connection: sqlite3.Connection) -> None:
-    """Create tables and indexes according to the defined schema."""
+def create_tables(connection: sqlite3.Connection) -> None:
+    """Create tables according to the defined schema."""
     cursor = connection.cursor()
     for name, query in TABLE_QUERIES.items():
         print(f"Creating table {name}...")
         cursor.execute(query)
-    for index_name, index_query in INDEX_QUERIES.items():
-        print(f"Creating index {index_name}...")
-        cursor.execute(index_query)
     connection.commit()
 
 
-def iter_records(df: pd.DataFrame) -> Iterable[Tuple]:
+def create_indexes(connection: sqlite3.Connection) -> None:
     """
-    Yield tuples matching DataFrame rows for insertion.
+    Create secondary indexes and refresh planner statistics.
 
-    Using `itertuples(index=False, name=None)` preserves column order and avoids
-    the overhead of creating pandas namedtuples.
+    Called after the bulk load so each index is built in one sorted pass
+    instead of being maintained row by row during insertion; the concluding
+    ANALYZE lets the query planner make use of the fresh indexes.
     """
-    return df.itertuples(index=False, name=None)
+    cursor = connection.cursor()
+    for index_name, index_query in INDEX_QUERIES.items():
+        print(f"Creating index {index_name}...")
+        cursor.execute(index_query)
+    cursor.execute("ANALYZE;")
+    connection.commit()
 
 
-def insert_data(connection: sqlite3.Connection, dataframes: Dict[str, pd.DataFrame]) -> None:
+def insert_data(connection: sqlite3.Connection, dataframe_futures: Dict[str, Future]) -> None:
     """
     Insert DataFrame contents into corresponding tables using transactions.
 
+    Each table is first staged into an in-memory database with
+    `DataFrame.to_sql` (multi-row INSERT statements, chunked to stay within
+    SQLite's bound-parameter limit) and then bulk-copied into the target file
+    with `INSERT INTO main.<table> SELECT * FROM stage.<table>`, which moves
+    rows between btrees inside SQLite without per-row statement binding.
+    Tables are consumed in dependency order as their background CSV reads
+    complete.
+
     Parameters
     ----------
     connection:
         Open SQLite connection with autocommit disabled.
-    dataframes:
-        Mapping of table names to populated DataFrames.
+    dataframe_futures:
+        Mapping of table names to pending DataFrame reads.
     """
-    insert_statements = {
-        "customers": """
-            INSERT INTO customers (
-                customer_id, first_name, last_name, email, phone, address, city,
-                state, zip_code, country, registration_date
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """,
-        "products": """
-            INSERT INTO products (
-                product_id, product_name, category, description, price,
-                stock_quantity, supplier, created_date
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-        """,
-        "orders": """
-            INSERT INTO orders (
-                order_id, customer_id, order_date, total_amount, status, payment_method
-            ) VALUES (?, ?, ?, ?, ?, ?);
-        """,
-        "order_items": """
-            INSERT INTO order_items (
-                order_item_id, order_id, product_id, quantity, unit_price, subtotal
-            ) VALUES (?, ?, ?, ?, ?, ?);
-        """,
-        "reviews": """
-            INSERT INTO reviews (
-                review_id, product_id, customer_id, rating, review_text, review_date
-            ) VALUES (?, ?, ?, ?, ?, ?);
-        """,
-    }
-
     cursor = connection.cursor()
+    stage = sqlite3.connect(STAGE_DATABASE_URI, uri=True)
+    # Per-row foreign key checks cost a btree lookup per insert; disable them
+    # for the bulk load and verify the whole database once afterwards.
+    connection.execute("PRAGMA foreign_keys = OFF;")
     try:
-        cursor.execute("BEGIN;")
-        for table_name, statement in insert_statements.items():
-            df = dataframes[table_name]
-            rows = list(iter_records(df))
-            print(f"Inserting {len(rows)} rows into {table_name}...")
-            cursor.executemany(statement, rows)
-        connection.commit()
-    except sqlite3.DatabaseError as error:
-        connection.rollback()
-        raise RuntimeError(f"Insertion failed: {error}") from error
+        # Stage every table first; the staging connection must be idle before
+        # the main connection reads the shared-cache database, or the two
+        # would contend for table locks.
+        for table_name, columns in TABLE_COLUMNS.items():
+            df = dataframe_futures[table_name].result()[list(columns)]
+            print(f"Staging {len(df)} rows for {table_name}...")
+            chunksize = min(10_000, SQLITE_MAX_VARIABLES // len(columns))
+            df.to_sql(
+                table_name,
+                stage,
+                if_exists="replace",
+                index=False,
+                method="multi",
+                chunksize=chunksize,
+            )
+        connection.execute(f"ATTACH '{STAGE_DATABASE_URI}' AS stage;")
+        try:
+            cursor.execute("BEGIN;")
+            for table_name in TABLE_COLUMNS:
+                print(f"Copying {table_name} into the database...")
+                cursor.execute(
+                    f"INSERT INTO main.{table_name} SELECT * FROM stage.{table_name};"
+                )
+            connection.commit()
+        except sqlite3.DatabaseError as error:
+            connection.rollback()
+            raise RuntimeError(f"Insertion failed: {error}") from error
+        finally:
+            connection.execute("DETACH stage;")
+    except (sqlite3.DatabaseError, ValueError) as error:
+        raise RuntimeError(f"Staging failed: {error}") from error
+    finally:
+        connection.execute("PRAGMA foreign_keys = ON;")
+        stage.close()
+    violations = connection.execute("PRAGMA foreign_key_check;").fetchall()
+    if violations:
+        raise RuntimeError(f"Foreign key violations detected after load: {violations}")
 
 
 def report_counts(connection: sqlite3.Connection) -> None:
@@ -229,12 +344,17 @@ def main() -> None:
     if not DATA_DIR.exists():
         raise FileNotFoundError(f"Data directory not found: {DATA_DIR.resolve()}")
 
-    dataframes = load_dataframes()
-    with connect_database(DATABASE_PATH) as connection:
-        drop_existing_tables(connection)
-        create_schema(connection)
-        insert_data(connection, dataframes)
-        report_counts(connection)
+    remove_existing_database(DATABASE_PATH)
+    with ThreadPoolExecutor(max_workers=len(CSV_SOURCES)) as executor:
+        dataframe_futures = load_dataframes_async(executor)
+        with connect_database(DATABASE_PATH) as connection:
+            drop_existing_tables(connection)
+            create_tables(connection)
+            insert_data(connection, dataframe_futures)
+            create_indexes(connection)
+            print("Compacting database with VACUUM...")
+            connection.execute("VACUUM;")
+            report_counts(connection)
     print(f"Ingestion completed. Database stored at {DATABASE_PATH.resolve()}")
 
 